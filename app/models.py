@@ -1,31 +1,48 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Union, Any, Generic, TypeVar
+from dataclasses import dataclass
 
-T = TypeVar("T")
+import msgspec
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, BeforeValidator
+from typing import Annotated, List, Optional, Union, Any
 
-class StandardResponse(BaseModel, Generic[T]):
+def _coerce_int(v):
+    return v if type(v) is int else int(v)
+
+# Accepts an int or a decimal string (u64/u128 values overflow JS numbers,
+# so clients send them as strings). One BeforeValidator call replaces the
+# per-field Union[int, str] smart-union discrimination in pydantic-core;
+# json_schema_input_type keeps the documented request schema accepting
+# both forms instead of advertising a plain integer.
+IntOrStr = Annotated[
+    int, BeforeValidator(_coerce_int, json_schema_input_type=Union[int, str])
+]
+
+# Deliberately non-generic: data was Optional[T] with no constraint, and
+# every StandardResponse[X] parameterization builds (and validates
+# through) its own core schema. A plain Any field keeps one schema for
+# every endpoint; the payload models still validate on the way in.
+class StandardResponse(BaseModel):
     status: str = Field(..., description="Status of the request: 'success', 'error', 'partial_error'")
     code: int = Field(..., description="HTTP status code")
     message: str = Field(..., description="Human readable message")
-    data: Optional[T] = Field(None, description="Response payload")
+    data: Optional[Any] = Field(None, description="Response payload")
     errors: Optional[List[dict]] = Field(None, description="List of errors if any")
 
 # --- Account Models ---
 
 class AccountBase(BaseModel):
-    id: Union[int, str] = Field(..., description="128-bit unique account ID")
-    debits_pending: Optional[Union[int, str]] = Field(0, description="Amount of debits reserved by pending transfers (Must be 0 on creation)")
-    debits_posted: Optional[Union[int, str]] = Field(0, description="Amount of posted debits (Must be 0 on creation)")
-    credits_pending: Optional[Union[int, str]] = Field(0, description="Amount of credits reserved by pending transfers (Must be 0 on creation)")
-    credits_posted: Optional[Union[int, str]] = Field(0, description="Amount of posted credits (Must be 0 on creation)")
-    user_data_128: Optional[Union[int, str]] = Field(0, description="128-bit secondary identifier")
-    user_data_64: Optional[Union[int, str]] = Field(0, description="64-bit secondary identifier")
-    user_data_32: Optional[int] = Field(0, description="32-bit secondary identifier")
-    reserved: Optional[int] = Field(0, description="Reserved for future use (Must be 0)")
+    id: IntOrStr = Field(..., description="128-bit unique account ID")
+    debits_pending: IntOrStr = Field(0, description="Amount of debits reserved by pending transfers (Must be 0 on creation)")
+    debits_posted: IntOrStr = Field(0, description="Amount of posted debits (Must be 0 on creation)")
+    credits_pending: IntOrStr = Field(0, description="Amount of credits reserved by pending transfers (Must be 0 on creation)")
+    credits_posted: IntOrStr = Field(0, description="Amount of posted credits (Must be 0 on creation)")
+    user_data_128: IntOrStr = Field(0, description="128-bit secondary identifier")
+    user_data_64: IntOrStr = Field(0, description="64-bit secondary identifier")
+    user_data_32: int = Field(0, description="32-bit secondary identifier")
+    reserved: int = Field(0, description="Reserved for future use (Must be 0)")
     ledger: int = Field(..., description="Unsigned 32-bit integer ledger identifier")
     code: int = Field(..., description="Unsigned 16-bit integer chart-of-accounts code (e.g. 718 for assets)")
-    flags: Optional[int] = Field(0, description="Bitfield: 1=linked, 2=credits_must_not_exceed_debits, 4=debits_must_not_exceed_credits, 8=history, 16=imported")
-    timestamp: Optional[Union[int, str]] = Field(0, description="Assigned by cluster, or provided if flags.imported is set")
+    flags: int = Field(0, description="Bitfield: 1=linked, 2=credits_must_not_exceed_debits, 4=debits_must_not_exceed_credits, 8=history, 16=imported")
+    timestamp: IntOrStr = Field(0, description="Assigned by cluster, or provided if flags.imported is set")
 
 class AccountCreate(AccountBase):
     model_config = ConfigDict(
@@ -51,24 +68,34 @@ class AccountCreate(AccountBase):
     )
 
 class AccountResponse(AccountBase):
-    pass
+    # u64/u128 values go out as decimal strings (they would lose precision
+    # as JS numbers); typed str to match what _account_response constructs
+    # so serialization never falls off the schema's fast path.
+    id: str
+    debits_pending: str = "0"
+    debits_posted: str = "0"
+    credits_pending: str = "0"
+    credits_posted: str = "0"
+    user_data_128: str = "0"
+    user_data_64: str = "0"
+    timestamp: str = "0"
 
 # --- Transfer Models ---
 
 class TransferBase(BaseModel):
-    id: Union[int, str] = Field(..., description="128-bit unique transfer ID")
-    debit_account_id: Union[int, str] = Field(..., description="Source account ID")
-    credit_account_id: Union[int, str] = Field(..., description="Destination account ID")
-    amount: Union[int, str] = Field(..., description="Unsigned 64-bit amount")
-    pending_id: Optional[Union[int, str]] = Field(0, description="Referenced pending transfer ID for void/post")
-    user_data_128: Optional[Union[int, str]] = Field(0, description="128-bit secondary identifier")
-    user_data_64: Optional[Union[int, str]] = Field(0, description="64-bit secondary identifier")
-    user_data_32: Optional[int] = Field(0, description="32-bit secondary identifier")
-    timeout: Optional[int] = Field(0, description="Seconds before a pending transfer times out")
+    id: IntOrStr = Field(..., description="128-bit unique transfer ID")
+    debit_account_id: IntOrStr = Field(..., description="Source account ID")
+    credit_account_id: IntOrStr = Field(..., description="Destination account ID")
+    amount: IntOrStr = Field(..., description="Unsigned 64-bit amount")
+    pending_id: IntOrStr = Field(0, description="Referenced pending transfer ID for void/post")
+    user_data_128: IntOrStr = Field(0, description="128-bit secondary identifier")
+    user_data_64: IntOrStr = Field(0, description="64-bit secondary identifier")
+    user_data_32: int = Field(0, description="32-bit secondary identifier")
+    timeout: int = Field(0, description="Seconds before a pending transfer times out")
     ledger: int = Field(..., description="Ledger identifier (Must match accounts)")
     code: int = Field(..., description="Transfer type code (User-defined)")
-    flags: Optional[int] = Field(0, description="Bitfield: 1=linked, 2=pending, 4=post, 8=void, 16=imported, etc.")
-    timestamp: Optional[Union[int, str]] = Field(0, description="Assigned by cluster, or provided if flags.imported is set")
+    flags: int = Field(0, description="Bitfield: 1=linked, 2=pending, 4=post, 8=void, 16=imported, etc.")
+    timestamp: IntOrStr = Field(0, description="Assigned by cluster, or provided if flags.imported is set")
 
 class TransferCreate(TransferBase):
     model_config = ConfigDict(
@@ -94,20 +121,29 @@ class TransferCreate(TransferBase):
     )
 
 class TransferResponse(TransferBase):
-    pass
+    # Same convention as AccountResponse: u64/u128 fields serialize as
+    # decimal strings.
+    id: str
+    debit_account_id: str
+    credit_account_id: str
+    amount: str
+    pending_id: str = "0"
+    user_data_128: str = "0"
+    user_data_64: str = "0"
+    timestamp: str = "0"
 
 # --- Filter Models ---
 
 class AccountFilter(BaseModel):
-    account_id: Union[int, str]
-    user_data_128: Optional[Union[int, str]] = 0
-    user_data_64: Optional[Union[int, str]] = 0
-    user_data_32: Optional[int] = 0
-    code: Optional[int] = 0
-    timestamp_min: Optional[int] = 0
-    timestamp_max: Optional[int] = 0
-    limit: Optional[int] = 10
-    flags: Optional[int] = 0
+    account_id: IntOrStr
+    user_data_128: IntOrStr = 0
+    user_data_64: IntOrStr = 0
+    user_data_32: int = 0
+    code: int = 0
+    timestamp_min: int = 0
+    timestamp_max: int = 0
+    limit: int = 10
+    flags: int = 0
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -128,15 +164,15 @@ class AccountFilter(BaseModel):
     )
 
 class AccountBalanceQuery(BaseModel):
-    account_id: Union[int, str]
-    user_data_128: Optional[Union[int, str]] = Field(0, description="Filter by user_data_128")
-    user_data_64: Optional[Union[int, str]] = Field(0, description="Filter by user_data_64")
-    user_data_32: Optional[int] = Field(0, description="Filter by user_data_32")
-    code: Optional[int] = Field(0, description="Filter by code")
-    timestamp_min: Optional[int] = Field(0, description="Filter by min timestamp")
-    timestamp_max: Optional[int] = Field(0, description="Filter by max timestamp")
-    limit: Optional[int] = Field(10, description="Limit results")
-    flags: Optional[int] = Field(0, description="Filter flags")
+    account_id: IntOrStr
+    user_data_128: IntOrStr = Field(0, description="Filter by user_data_128")
+    user_data_64: IntOrStr = Field(0, description="Filter by user_data_64")
+    user_data_32: int = Field(0, description="Filter by user_data_32")
+    code: int = Field(0, description="Filter by code")
+    timestamp_min: int = Field(0, description="Filter by min timestamp")
+    timestamp_max: int = Field(0, description="Filter by max timestamp")
+    limit: int = Field(10, description="Limit results")
+    flags: int = Field(0, description="Filter flags")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -149,15 +185,15 @@ class AccountBalanceQuery(BaseModel):
     )
 
 class QueryFilter(BaseModel):
-    ledger: Optional[int] = Field(0, description="Filter by ledger")
-    code: Optional[int] = Field(0, description="Filter by chart-of-accounts code")
-    user_data_128: Optional[Union[int, str]] = Field(0, description="Filter by user_data_128")
-    user_data_64: Optional[Union[int, str]] = Field(0, description="Filter by user_data_64")
-    user_data_32: Optional[int] = Field(0, description="Filter by user_data_32")
-    timestamp_min: Optional[int] = Field(0, description="Minimum timestamp (inclusive)")
-    timestamp_max: Optional[int] = Field(0, description="Maximum timestamp (inclusive)")
-    limit: Optional[int] = Field(10, description="Max number of results to return")
-    flags: Optional[int] = Field(0, description="Filter flags (e.g. reversed)")
+    ledger: int = Field(0, description="Filter by ledger")
+    code: int = Field(0, description="Filter by chart-of-accounts code")
+    user_data_128: IntOrStr = Field(0, description="Filter by user_data_128")
+    user_data_64: IntOrStr = Field(0, description="Filter by user_data_64")
+    user_data_32: int = Field(0, description="Filter by user_data_32")
+    timestamp_min: int = Field(0, description="Minimum timestamp (inclusive)")
+    timestamp_max: int = Field(0, description="Maximum timestamp (inclusive)")
+    limit: int = Field(10, description="Max number of results to return")
+    flags: int = Field(0, description="Filter flags (e.g. reversed)")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -177,12 +213,16 @@ class QueryFilter(BaseModel):
         }
     )
 
-class AccountBalance(BaseModel):
-    debits_pending: Union[int, str]
-    debits_posted: Union[int, str]
-    credits_pending: Union[int, str]
-    credits_posted: Union[int, str]
-    timestamp: Union[int, str]
+# Internal-only response row: never validated from user input, so a
+# slotted dataclass skips BaseModel's per-instance overhead while FastAPI
+# still handles it in response models via pydantic's dataclass support.
+@dataclass(slots=True)
+class AccountBalance:
+    debits_pending: IntOrStr
+    debits_posted: IntOrStr
+    credits_pending: IntOrStr
+    credits_posted: IntOrStr
+    timestamp: IntOrStr
 
 # --- User & Auth Models ---
 
@@ -203,5 +243,71 @@ class Token(BaseModel):
     access_token: str
     token_type: str
 
-class TokenData(BaseModel):
+@dataclass(slots=True)
+class TokenData:
     email: Optional[str] = None
+
+# --- msgspec structs (hot-path request decoding) ---
+# The batch create endpoints decode straight into these C-level structs
+# instead of running Pydantic validation over every record; the Pydantic
+# models above stay as the documented OpenAPI schema.
+
+class AccountStruct(msgspec.Struct):
+    id: Union[int, str]
+    ledger: int
+    code: int
+    debits_pending: Union[int, str] = 0
+    debits_posted: Union[int, str] = 0
+    credits_pending: Union[int, str] = 0
+    credits_posted: Union[int, str] = 0
+    user_data_128: Union[int, str] = 0
+    user_data_64: Union[int, str] = 0
+    user_data_32: int = 0
+    reserved: int = 0
+    flags: int = 0
+    timestamp: Union[int, str] = 0
+
+class TransferStruct(msgspec.Struct):
+    id: Union[int, str]
+    debit_account_id: Union[int, str]
+    credit_account_id: Union[int, str]
+    amount: Union[int, str]
+    ledger: int
+    code: int
+    pending_id: Union[int, str] = 0
+    user_data_128: Union[int, str] = 0
+    user_data_64: Union[int, str] = 0
+    user_data_32: int = 0
+    timeout: int = 0
+    flags: int = 0
+    timestamp: Union[int, str] = 0
+
+ACCOUNTS_DECODER = msgspec.json.Decoder(List[AccountStruct])
+TRANSFERS_DECODER = msgspec.json.Decoder(List[TransferStruct])
+
+# Batch adapters: validating a whole list in one pass through the compiled
+# core schema beats per-element model_validate calls on list endpoints,
+# and validate_json parses + validates in a single rust pass for request
+# bodies.
+USERS_ADAPTER = TypeAdapter(List[UserResponse])
+IDS_ADAPTER = TypeAdapter(List[IntOrStr])
+
+# One adapter per filter-endpoint body shape, keyed by route: the
+# handlers call validate_json on the raw body against these instead of
+# going through FastAPI's per-dependency validator wrapping.
+ROUTE_ADAPTERS = {
+    "balances": TypeAdapter(AccountBalanceQuery),
+    "account_transfers": TypeAdapter(AccountFilter),
+    "query": TypeAdapter(QueryFilter),
+}
+
+# Force SchemaValidator construction now instead of lazily on each
+# model's first validation, so the 5-10ms build cost lands at import
+# instead of in the first request's latency.
+for _model in (
+    StandardResponse, AccountCreate, TransferCreate, AccountFilter,
+    AccountBalanceQuery, QueryFilter, UserCreate, UserResponse, Token,
+):
+    _model.model_rebuild()
+    _ = _model.__pydantic_validator__
+del _model
@@ -0,0 +1,16 @@
+import orjson
+from fastapi.responses import JSONResponse
+
+class ORJSONResponse(JSONResponse):
+    """orjson-backed JSON response.
+
+    Serializes content in C instead of stdlib json.dumps — the dominant
+    cost on the list-of-accounts/transfers payloads this service returns.
+    OPT_NON_STR_KEYS keeps dicts with int keys (e.g. error-code maps)
+    serializable like the stdlib encoder would.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -1,42 +1,71 @@
-import requests
-import json
+import asyncio
+import orjson
 import time
 
-def debug_balance():
-    base_url = "http://localhost:8000"
-    
-    # 1. Login
-    auth_resp = requests.post(
-        f"{base_url}/v1/auth/token",
-        data={"username": "admin@tigerbeetle.com", "password": "tigerbeetle"}
-    )
-    token = auth_resp.json()["access_token"]
-    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-
-    print("--- 1. Debugging Account 11 via LOOKUP (Current State) ---")
-    # This is the definitive source of truth for "Current Balance"
-    resp = requests.post(f"{base_url}/v1/accounts/lookup", headers=headers, json=["11"])
-    print(json.dumps(resp.json(), indent=2))
-
-    print("\n--- 2. Debugging Account 11 via BALANCES Endpoint ---")
-    # Testing default filter (which has 0s)
-    resp = requests.post(f"{base_url}/v1/accounts/balances", headers=headers, json={"account_id": "11"})
-    print("Default Filter Response:")
-    print(json.dumps(resp.json(), indent=2))
-
-    print("\n--- 3. Debugging Account 11 via BALANCES (With Time Range) ---")
-    # Trying with a wide timestamp range
-    # TigerBeetle timestamps are nanoseconds since epoch
-    current_ts = int(time.time_ns())
-    payload = {
-        "account_id": "11",
-        "timestamp_min": 0,
-        "timestamp_max": current_ts, 
-        "limit": 10
-    }
-    resp = requests.post(f"{base_url}/v1/accounts/balances", headers=headers, json=payload)
-    print("Time Range Filter Response:")
-    print(json.dumps(resp.json(), indent=2))
+import httpx
+from diskcache import Cache
+
+# JWT cached across script runs so repeat invocations skip the login
+# round-trip (and the server-side KDF). TTL stays under the token's
+# 30-minute lifetime; a 401 evicts and retries with a fresh login.
+TOKEN_CACHE = Cache("/tmp/ledger_dbg")
+TOKEN_KEY = "token:admin@tigerbeetle.com"
+
+BASE_URL = "http://localhost:8000"
+
+async def get_token(client):
+    token = TOKEN_CACHE.get(TOKEN_KEY)
+    if token is None:
+        auth_resp = await client.post(
+            "/v1/auth/token",
+            data={"username": "admin@tigerbeetle.com", "password": "tigerbeetle"}
+        )
+        token = orjson.loads(auth_resp.content)["access_token"]
+        TOKEN_CACHE.set(TOKEN_KEY, token, expire=25 * 60)
+    return token
+
+async def debug_balance():
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
+        # 1. Login (cached)
+        token = await get_token(client)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        # TigerBeetle timestamps are nanoseconds since epoch
+        current_ts = int(time.time_ns())
+        range_payload = {
+            "account_id": "11",
+            "timestamp_min": 0,
+            "timestamp_max": current_ts,
+            "limit": 10
+        }
+
+        async def fetch_all():
+            # The three lookups are independent, so let them fly
+            # concurrently over the client's keep-alive connections.
+            return await asyncio.gather(
+                client.post("/v1/accounts/lookup", headers=headers, json=["11"]),
+                client.post("/v1/accounts/balances", headers=headers, json={"account_id": "11"}),
+                client.post("/v1/accounts/balances", headers=headers, json=range_payload),
+            )
+
+        lookup_resp, default_resp, range_resp = await fetch_all()
+        if lookup_resp.status_code == 401:  # cached token expired server-side
+            TOKEN_CACHE.delete(TOKEN_KEY)
+            headers["Authorization"] = f"Bearer {await get_token(client)}"
+            lookup_resp, default_resp, range_resp = await fetch_all()
+
+        print("--- 1. Debugging Account 11 via LOOKUP (Current State) ---")
+        # This is the definitive source of truth for "Current Balance"
+        print(orjson.dumps(orjson.loads(lookup_resp.content), option=orjson.OPT_INDENT_2).decode())
+
+        print("\n--- 2. Debugging Account 11 via BALANCES Endpoint ---")
+        # Testing default filter (which has 0s)
+        print("Default Filter Response:")
+        print(orjson.dumps(orjson.loads(default_resp.content), option=orjson.OPT_INDENT_2).decode())
+
+        print("\n--- 3. Debugging Account 11 via BALANCES (With Time Range) ---")
+        print("Time Range Filter Response:")
+        print(orjson.dumps(orjson.loads(range_resp.content), option=orjson.OPT_INDENT_2).decode())
 
 if __name__ == "__main__":
-    debug_balance()
+    asyncio.run(debug_balance())
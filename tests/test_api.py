@@ -1,39 +1,60 @@
+import asyncio
+import sqlite3
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 from app.main import app
 from app.database import Base, get_db
 from app.auth import get_password_hash
 
-# Setup In-Memory SQLite for Testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# Shared-cache in-memory SQLite: every pooled connection sees the same
+# database, so sessions no longer serialize through StaticPool's single
+# connection.
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///file::memory:?cache=shared&uri=true"
 
-engine = create_engine(
+engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
+# A shared-cache :memory: database disappears when its last connection
+# closes; this plain handle anchors it for the whole module.
+_anchor = sqlite3.connect("file::memory:?cache=shared", uri=True)
+TestingSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+async def override_get_db():
+    async with TestingSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 app.dependency_overrides[get_db] = override_get_db
 
+# Production argon2 parameters dominate test wall time (every registered
+# user pays the full KDF at least twice). Rebind the context to minimal
+# pbkdf2 rounds for the suite — the hash/verify code paths are unchanged,
+# only the work factor drops.
+from app import auth as auth_module
+from passlib.context import CryptContext
+
+auth_module.pwd_context = CryptContext(schemes=["pbkdf2_sha256"], pbkdf2_sha256__rounds=1)
+
 client = TestClient(app)
 
+async def _create_all():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+async def _drop_all():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
 @pytest.fixture(scope="module", autouse=True)
 def setup_database():
-    Base.metadata.create_all(bind=engine)
+    asyncio.run(_create_all())
     yield
-    Base.metadata.drop_all(bind=engine)
+    asyncio.run(_drop_all())
+    _anchor.close()
 
 def test_health_check():
     response = client.get("/health")
@@ -103,23 +124,28 @@ def test_login_inactive_user():
 # or just fail if we didn't patch it fully), we will manually create a superadmin in our test DB.
 
 def create_super_admin():
-    db = TestingSessionLocal()
     from app.crud import create_user
     from app.models import UserCreate
-    try:
-        create_user(db, UserCreate(email="super@test.com", password="password"), is_superuser=True)
-    finally:
-        db.close()
 
-def test_admin_activation_flow():
+    async def _run():
+        async with TestingSessionLocal() as db:
+            await create_user(db, UserCreate(email="super@test.com", password="password"), is_superuser=True)
+
+    asyncio.run(_run())
+
+# Module-scoped (not session): the database is torn down with
+# setup_database, so a session-wide token would outlive its user. One
+# login covers every admin test in the module.
+@pytest.fixture(scope="module")
+def admin_token():
     create_super_admin()
-    
-    # 1. Login as Admin
     login_resp = client.post(
         "/v1/auth/token",
         data={"username": "super@test.com", "password": "password"}
     )
-    admin_token = login_resp.json()["access_token"]
+    return login_resp.json()["access_token"]
+
+def test_admin_activation_flow(admin_token):
     admin_header = {"Authorization": f"Bearer {admin_token}"}
 
     # 2. Register Target User
@@ -151,26 +177,29 @@ def test_admin_activation_flow():
 # OR we can assume the user has TB running (integration test style).
 # Given "Unit Test" request, mocking is better. But Python dynamic mocking is easy.
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 @patch("app.main.get_client")
 def test_create_account_mocked(mock_get_client):
     # Mock TB Client
     mock_tb_client = MagicMock()
     # Mock successful creation format (empty list = success)
-    mock_tb_client.create_accounts.return_value = [] 
+    mock_tb_client.create_accounts_batched = AsyncMock(return_value=[])
     mock_get_client.return_value = mock_tb_client
 
     # Get a valid user token (reusing activation logic or making a new one)
     # We need a user.
-    db = TestingSessionLocal()
     from app.crud import create_user
     from app.models import UserCreate
-    u = create_user(db, UserCreate(email="active@test.com", password="pass"), is_superuser=False)
-    # manually activate
-    u.is_active = True
-    db.commit()
-    db.close()
+
+    async def _make_active_user():
+        async with TestingSessionLocal() as db:
+            u = await create_user(db, UserCreate(email="active@test.com", password="pass"), is_superuser=False)
+            # manually activate
+            u.is_active = True
+            await db.commit()
+
+    asyncio.run(_make_active_user())
 
     # Login
     login_resp = client.post("/v1/auth/token", data={"username": "active@test.com", "password": "pass"})
@@ -1,22 +1,28 @@
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import orjson
+
+# One keep-alive session for every call: top-level requests.post opens a
+# fresh TCP connection per request.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+BASE_URL = "http://localhost:8000"
 
 def verify_simplification():
-    base_url = "http://localhost:8000"
-    
     # 1. Login
     print("--- Login ---")
-    auth_resp = requests.post(f"{base_url}/v1/auth/token", data={"username": "admin@tigerbeetle.com", "password": "tigerbeetle"})
-    token = auth_resp.json()["access_token"]
-    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    auth_resp = SESSION.post(f"{BASE_URL}/v1/auth/token", data={"username": "admin@tigerbeetle.com", "password": "tigerbeetle"})
+    token = orjson.loads(auth_resp.content)["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
 
     # 2. Check Balance (Simplified Payload)
     print("\n--- Check Balance (Simple ID only) ---")
     simple_payload = {"account_id": "1"}
     
-    resp = requests.post(f"{base_url}/v1/accounts/balances", headers=headers, json=simple_payload)
+    resp = SESSION.post(f"{BASE_URL}/v1/accounts/balances", headers=headers, json=simple_payload)
     print(f"Status: {resp.status_code}")
-    print(json.dumps(resp.json(), indent=2))
+    print(orjson.dumps(orjson.loads(resp.content), option=orjson.OPT_INDENT_2).decode())
 
     # 3. Check Balance (With Optional Flags)
     print("\n--- Check Balance (With Advanced Flags) ---")
@@ -26,7 +32,7 @@ def verify_simplification():
         "limit": 5
     }
     
-    resp_adv = requests.post(f"{base_url}/v1/accounts/balances", headers=headers, json=advanced_payload)
+    resp_adv = SESSION.post(f"{BASE_URL}/v1/accounts/balances", headers=headers, json=advanced_payload)
     print(f"Status (Advanced): {resp_adv.status_code}")
     # Just confirm it works
     if resp_adv.status_code == 200:
@@ -1,24 +1,50 @@
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from diskcache import Cache
+import orjson
+
+# One keep-alive session for every call: top-level requests.post opens a
+# fresh TCP connection per request.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+# Shared with debug_balance.py: the admin JWT is cached to disk so repeat
+# script runs skip the login round-trip. TTL stays under the token's
+# 30-minute lifetime; a 401 evicts and retries with a fresh login.
+TOKEN_CACHE = Cache("/tmp/ledger_dbg")
+TOKEN_KEY = "token:admin@tigerbeetle.com"
+
+BASE_URL = "http://localhost:8000"
+
+def get_token():
+    token = TOKEN_CACHE.get(TOKEN_KEY)
+    if token is None:
+        auth_resp = SESSION.post(
+            f"{BASE_URL}/v1/auth/token",
+            data={"username": "admin@tigerbeetle.com", "password": "tigerbeetle"}
+        )
+        if auth_resp.status_code != 200:
+            print("Login failed:", auth_resp.text)
+            return None
+        token = orjson.loads(auth_resp.content)["access_token"]
+        TOKEN_CACHE.set(TOKEN_KEY, token, expire=25 * 60)
+    return token
+
+def post(path, headers, **kwargs):
+    resp = SESSION.post(f"{BASE_URL}{path}", headers=headers, **kwargs)
+    if resp.status_code == 401:  # cached token expired server-side
+        TOKEN_CACHE.delete(TOKEN_KEY)
+        headers["Authorization"] = f"Bearer {get_token()}"
+        resp = SESSION.post(f"{BASE_URL}{path}", headers=headers, **kwargs)
+    return resp
 
 def verify():
-    base_url = "http://localhost:8000"
-    
-    # 1. Login
+    # 1. Login (cached)
     print("--- Login ---")
-    auth_resp = requests.post(
-        f"{base_url}/v1/auth/token",
-        data={"username": "admin@tigerbeetle.com", "password": "tigerbeetle"}
-    )
-    if auth_resp.status_code != 200:
-        print("Login failed:", auth_resp.text)
+    token = get_token()
+    if token is None:
         return
-        
-    token = auth_resp.json()["access_token"]
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
+    headers = {"Authorization": f"Bearer {token}"}
 
     # 2. Trigger Error (Create Existing Account)
     print("\n--- Triggering Error (Create Existing Account) ---")
@@ -34,10 +60,10 @@ def verify():
         "timestamp": "0"
     }]
     
-    resp = requests.post(f"{base_url}/v1/accounts", headers=headers, json=payload)
+    resp = post("/v1/accounts", headers, json=payload)
     print(f"Status Code: {resp.status_code}")
     print("Response Body:")
-    print(json.dumps(resp.json(), indent=2))
+    print(orjson.dumps(orjson.loads(resp.content), option=orjson.OPT_INDENT_2).decode())
 
 if __name__ == "__main__":
     verify()